@@ -3,10 +3,18 @@ import fastf1
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
 import os
 import numpy as np
+from collections import namedtuple
 from datetime import timedelta
 
+# Serialize figures with orjson instead of the stdlib json encoder
+pio.json.config.default_engine = "orjson"
+
+# Apply the dark template to every figure instead of per update_layout call
+pio.templates.default = 'plotly_dark'
+
 # Page config
 st.set_page_config(
     page_title="Abu Dhabi 2021 F1 Analysis",
@@ -38,229 +46,178 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data
-def load_race_data():
-    """Load and cache F1 race data"""
-    try:
-        # Create cache directory
-        if not os.path.exists('./cache'):
-            os.makedirs('./cache')
-        
-        fastf1.Cache.enable_cache('./cache')
-        
-        with st.spinner('Loading F1 race data... This might take a moment.'):
-            session = fastf1.get_session(2021, 'Abu Dhabi', 'R')
-            session.load()
-        
-        return session
-    except Exception as e:
-        st.error(f"Error loading data: {str(e)}")
-        return None
+Tel = namedtuple('Tel', 'Distance Speed Throttle Brake nGear RPM')
 
-def get_telemetry_data(session):
-    """Get telemetry data for both drivers"""
-    laps = session.laps
-    
-    # Fastest laps
-    ver_fastest = laps.pick_drivers('VER').pick_fastest()
-    ham_fastest = laps.pick_drivers('HAM').pick_fastest()
+# Narrowest dtype that still displays each channel faithfully
+TEL_DTYPES = {
+    'Distance': np.float32,
+    'Speed': np.float32,
+    'Throttle': np.float32,
+    'Brake': np.bool_,
+    'nGear': np.int8,
+    'RPM': np.float32
+}
+
+def _tel_frame(tel):
+    """Slim a telemetry frame to the plotted channels, downcast per TEL_DTYPES"""
+    return pd.DataFrame({col: tel[col].values.astype(TEL_DTYPES[col]) for col in Tel._fields})
+
+def _to_tel(tel):
+    """Convert a telemetry frame to contiguous, downcast arrays, one per channel"""
+    return Tel(*(np.ascontiguousarray(tel[col].values, dtype=TEL_DTYPES[col]) for col in Tel._fields))
+
+# Lap columns used by the race pace and position charts
+LAP_COLUMNS = ['LapNumber', 'LapTime', 'Position']
+
+@st.cache_resource
+def _init_fastf1():
+    """Create the FastF1 cache directory and enable the cache, once per process"""
+    os.makedirs('./cache', exist_ok=True)
+    fastf1.Cache.enable_cache('./cache')
+    return True
+
+# Pre-extracted race data written by extract_data.py
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+REQUIRED_FRAMES = ('ver_tel', 'ham_tel', 'ver_laps', 'ham_laps')
+OPTIONAL_FRAMES = ('lap58_ver_tel', 'lap58_ham_tel')
+
+def extract_race_frames():
+    """Load the race session and extract the frames the app plots"""
+    _init_fastf1()
     
-    # Get telemetry
-    ver_tel = ver_fastest.get_telemetry()
-    ham_tel = ham_fastest.get_telemetry()
+    session = fastf1.get_session(2021, 'Abu Dhabi', 'R')
+    session.load()
+    laps = session.laps
     
-    # All laps for race pace
+    # Filter each driver's laps once and reuse them below
     ver_laps = laps.pick_drivers('VER')
     ham_laps = laps.pick_drivers('HAM')
     
-    return ver_tel, ham_tel, ver_laps, ham_laps
-
-def create_speed_chart(ver_tel, ham_tel):
-    """Create speed vs distance chart"""
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=ver_tel['Distance'], 
-        y=ver_tel['Speed'],
-        mode='lines', 
-        name='Verstappen', 
-        line=dict(color='#E74C3C', width=3)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=ham_tel['Distance'], 
-        y=ham_tel['Speed'],
-        mode='lines', 
-        name='Hamilton', 
-        line=dict(color='#3498DB', width=3)
-    ))
+    # Fastest laps
+    ver_fastest = ver_laps.pick_fastest()
+    ham_fastest = ham_laps.pick_fastest()
     
-    fig.update_layout(
-        title='🏎️ Speed vs Distance - Fastest Lap Comparison',
-        xaxis_title='Distance (m)', 
-        yaxis_title='Speed (km/h)',
-        template='plotly_dark', 
-        hovermode='x unified', 
-        height=500,
-        font=dict(size=12)
+    # Final lap telemetry, slimmed to the columns the Lap 58 chart uses
+    try:
+        ver_lap58 = ver_laps.loc[ver_laps['LapNumber'] == 58].iloc[0]
+        ham_lap58 = ham_laps.loc[ham_laps['LapNumber'] == 58].iloc[0]
+        lap58_ver_tel = pd.DataFrame(ver_lap58.get_telemetry().add_distance()[['Distance', 'Speed']])
+        lap58_ham_tel = pd.DataFrame(ham_lap58.get_telemetry().add_distance()[['Distance', 'Speed']])
+    except Exception:
+        lap58_ver_tel = lap58_ham_tel = None
+    
+    return dict(
+        ver_tel=_tel_frame(ver_fastest.get_telemetry()),
+        ham_tel=_tel_frame(ham_fastest.get_telemetry()),
+        ver_laps=pd.DataFrame(ver_laps[LAP_COLUMNS]),
+        ham_laps=pd.DataFrame(ham_laps[LAP_COLUMNS]),
+        lap58_ver_tel=lap58_ver_tel,
+        lap58_ham_tel=lap58_ham_tel
     )
-    
-    return fig
 
-def create_throttle_chart(ver_tel, ham_tel):
-    """Create throttle vs distance chart"""
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=ver_tel['Distance'], 
-        y=ver_tel['Throttle'],
-        mode='lines', 
-        name='Verstappen', 
-        line=dict(color='#FF6B35', width=3)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=ham_tel['Distance'], 
-        y=ham_tel['Throttle'],
-        mode='lines', 
-        name='Hamilton', 
-        line=dict(color='#2ECC71', width=3)
-    ))
-    
-    fig.update_layout(
-        title='🚀 Throttle Application vs Distance',
-        xaxis_title='Distance (m)', 
-        yaxis_title='Throttle (%)',
-        template='plotly_dark', 
-        hovermode='x unified', 
-        height=500
-    )
-    
-    return fig
+def _frame_paths():
+    """Parquet sidecar path for every frame, keyed by frame name"""
+    return {name: os.path.join(DATA_DIR, f'{name}.parquet') for name in REQUIRED_FRAMES + OPTIONAL_FRAMES}
 
-def create_brake_chart(ver_tel, ham_tel):
-    """Create brake vs distance chart"""
-    # Convert brake boolean to integer
-    ver_tel_copy = ver_tel.copy()
-    ham_tel_copy = ham_tel.copy()
-    ver_tel_copy['Brake'] = ver_tel_copy['Brake'].astype(int)
-    ham_tel_copy['Brake'] = ham_tel_copy['Brake'].astype(int)
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=ver_tel_copy['Distance'], 
-        y=ver_tel_copy['Brake'],
-        mode='lines', 
-        name='Verstappen', 
-        line=dict(color='#9B59B6', width=3)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=ham_tel_copy['Distance'], 
-        y=ham_tel_copy['Brake'],
-        mode='lines', 
-        name='Hamilton', 
-        line=dict(color='#1ABC9C', width=3)
-    ))
-    
-    fig.update_layout(
-        title='🛑 Brake Application vs Distance',
-        xaxis_title='Distance (m)', 
-        yaxis_title='Brake (On/Off)',
-        template='plotly_dark', 
-        hovermode='x unified', 
-        height=500
-    )
-    
-    return fig
+def _sidecar_key():
+    """Modification times of the sidecar files, so a regenerated sidecar invalidates the cache"""
+    return tuple(os.path.getmtime(path) if os.path.exists(path) else None for path in _frame_paths().values())
 
-def create_gear_chart(ver_tel, ham_tel):
-    """Create gear usage chart"""
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=ver_tel['Distance'],
-        y=ver_tel['nGear'],
-        mode='lines',
-        name='Verstappen',
-        line=dict(color='#E74C3C', width=3)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=ham_tel['Distance'],
-        y=ham_tel['nGear'],
-        mode='lines',
-        name='Hamilton',
-        line=dict(color='#3498DB', width=3)
-    ))
-    
-    fig.update_layout(
-        title='⚙️ Gear Usage vs Distance',
-        xaxis_title='Distance (m)',
-        yaxis_title='Gear Number',
-        template='plotly_dark',
-        hovermode='x unified',
-        height=500
-    )
-    
-    return fig
+def _read_race_frames():
+    """Read the parquet sidecar from DATA_DIR, or None if it has not been extracted"""
+    paths = _frame_paths()
+    if not all(os.path.exists(paths[name]) for name in REQUIRED_FRAMES):
+        return None
+    return {
+        name: pd.read_parquet(path, engine='pyarrow') if os.path.exists(path) else None
+        for name, path in paths.items()
+    }
 
-def create_rpm_chart(ver_tel, ham_tel):
-    """Create RPM chart"""
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=ver_tel['Distance'],
-        y=ver_tel['RPM'],
-        mode='lines',
-        name='Verstappen',
-        line=dict(color='#E74C3C', width=3)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=ham_tel['Distance'],
-        y=ham_tel['RPM'],
-        mode='lines',
-        name='Hamilton',
-        line=dict(color='#3498DB', width=3)
-    ))
-    
-    fig.update_layout(
-        title='🔄 RPM vs Distance',
-        xaxis_title='Distance (m)',
-        yaxis_title='RPM',
-        template='plotly_dark',
-        hovermode='x unified',
-        height=500
-    )
-    
-    return fig
+# In-memory only: the parquet sidecar already is the on-disk copy, and a pickled
+# entry would not be invalidated by edits to the helpers this function calls
+@st.cache_data(show_spinner="Loading F1 race data…")
+def _extract_race_data(sidecar_key):
+    """Load the race frames from the parquet sidecar, falling back to FastF1"""
+    data = _read_race_frames()
+    if data is None:
+        data = extract_race_frames()
+    
+    data['ver_tel'] = _to_tel(data['ver_tel'])
+    data['ham_tel'] = _to_tel(data['ham_tel'])
+    return data
+
+def load_race_data():
+    """Load and cache F1 race data"""
+    # Errors are raised out of the cached loader so a failed load is never cached
+    try:
+        return _extract_race_data(_sidecar_key())
+    except Exception as e:
+        st.error(f"Error loading data: {str(e)}")
+        return None
+
+# Telemetry tabs: channel, title, y-axis title, (Verstappen, Hamilton) colors
+TEL_CHARTS = [
+    ('Speed', '🏎️ Speed vs Distance - Fastest Lap Comparison', 'Speed (km/h)', ('#E74C3C', '#3498DB')),
+    ('Throttle', '🚀 Throttle Application vs Distance', 'Throttle (%)', ('#FF6B35', '#2ECC71')),
+    ('Brake', '🛑 Brake Application vs Distance', 'Brake (On/Off)', ('#9B59B6', '#1ABC9C')),
+    ('nGear', '⚙️ Gear Usage vs Distance', 'Gear Number', ('#E74C3C', '#3498DB')),
+    ('RPM', '🔄 RPM vs Distance', 'RPM', ('#E74C3C', '#3498DB'))
+]
+
+def _channel_values(values):
+    """Reinterpret a boolean channel (Brake) as 0/1 without copying"""
+    return values.view(np.uint8) if values.dtype == bool else values
+
+def build_tel_figs(ver_tel, ham_tel):
+    """Create the telemetry vs distance charts, keyed by channel"""
+    figs = {}
+    for channel, title, yaxis_title, (ver_color, ham_color) in TEL_CHARTS:
+        fig = go.Figure()
+        
+        for name, tel, color in (('Verstappen', ver_tel, ver_color), ('Hamilton', ham_tel, ham_color)):
+            fig.add_trace(go.Scattergl(
+                x=tel.Distance,
+                y=_channel_values(getattr(tel, channel)),
+                mode='lines',
+                name=name,
+                line=dict(color=color, width=3)
+            ))
+        
+        fig.update_layout(
+            title=title,
+            xaxis_title='Distance (m)',
+            yaxis_title=yaxis_title,
+            hovermode='x unified',
+            height=500
+        )
+        figs[channel] = fig
+    
+    return figs
+
+def _clean_laps(laps):
+    """Get (lap number, lap time in seconds) arrays for laps with a recorded time"""
+    m = laps['LapTime'].notna().values
+    return laps['LapNumber'].values[m], laps['LapTime'].values[m].astype('timedelta64[ms]').view('i8') / 1000.0
 
 def create_laptime_chart(ver_laps, ham_laps):
     """Create lap time comparison chart"""
-    # Clean data
-    ver_laps_clean = ver_laps[ver_laps['LapTime'].notnull()].copy()
-    ham_laps_clean = ham_laps[ham_laps['LapTime'].notnull()].copy()
-    
-    # Convert to seconds
-    ver_laps_clean['LapTime_s'] = ver_laps_clean['LapTime'].dt.total_seconds()
-    ham_laps_clean['LapTime_s'] = ham_laps_clean['LapTime'].dt.total_seconds()
+    ver_lapnums, ver_times = _clean_laps(ver_laps)
+    ham_lapnums, ham_times = _clean_laps(ham_laps)
     
     fig = go.Figure()
     
-    fig.add_trace(go.Scatter(
-        x=ver_laps_clean['LapNumber'],
-        y=ver_laps_clean['LapTime_s'],
+    fig.add_trace(go.Scattergl(
+        x=ver_lapnums,
+        y=ver_times,
         mode='lines+markers',
         name='Verstappen',
         line=dict(color='#E74C3C', width=3),
         marker=dict(size=6)
     ))
     
-    fig.add_trace(go.Scatter(
-        x=ham_laps_clean['LapNumber'],
-        y=ham_laps_clean['LapTime_s'],
+    fig.add_trace(go.Scattergl(
+        x=ham_lapnums,
+        y=ham_times,
         mode='lines+markers',
         name='Hamilton',
         line=dict(color='#3498DB', width=3),
@@ -288,7 +245,6 @@ def create_laptime_chart(ver_laps, ham_laps):
         title='⏱️ Lap Time Evolution Throughout the Race',
         xaxis_title='Lap Number',
         yaxis_title='Lap Time (seconds)',
-        template='plotly_dark',
         hovermode='x unified',
         height=600
     )
@@ -297,30 +253,27 @@ def create_laptime_chart(ver_laps, ham_laps):
 
 def create_final_laps_chart(ver_laps, ham_laps):
     """Create final 10 laps comparison"""
-    ver_laps_clean = ver_laps[ver_laps['LapTime'].notnull()].copy()
-    ham_laps_clean = ham_laps[ham_laps['LapTime'].notnull()].copy()
+    ver_lapnums, ver_times = _clean_laps(ver_laps)
+    ham_lapnums, ham_times = _clean_laps(ham_laps)
     
-    ver_laps_clean['LapTime_s'] = ver_laps_clean['LapTime'].dt.total_seconds()
-    ham_laps_clean['LapTime_s'] = ham_laps_clean['LapTime'].dt.total_seconds()
-    
-    # Filter final 10 laps
-    ver_final = ver_laps_clean[ver_laps_clean['LapNumber'] >= 49]
-    ham_final = ham_laps_clean[ham_laps_clean['LapNumber'] >= 49]
+    # Final 10 laps; lap numbers are sorted, so slice from the first lap >= 49
+    ver_start = np.searchsorted(ver_lapnums, 49)
+    ham_start = np.searchsorted(ham_lapnums, 49)
     
     fig = go.Figure()
     
-    fig.add_trace(go.Scatter(
-        x=ver_final['LapNumber'],
-        y=ver_final['LapTime_s'],
+    fig.add_trace(go.Scattergl(
+        x=ver_lapnums[ver_start:],
+        y=ver_times[ver_start:],
         mode='lines+markers',
         name='Verstappen',
         line=dict(color='#E74C3C', width=4),
         marker=dict(size=8)
     ))
     
-    fig.add_trace(go.Scatter(
-        x=ham_final['LapNumber'],
-        y=ham_final['LapTime_s'],
+    fig.add_trace(go.Scattergl(
+        x=ham_lapnums[ham_start:],
+        y=ham_times[ham_start:],
         mode='lines+markers',
         name='Hamilton',
         line=dict(color='#3498DB', width=4),
@@ -331,7 +284,6 @@ def create_final_laps_chart(ver_laps, ham_laps):
         title='🔥 Final 10 Laps - The Championship Decider',
         xaxis_title='Lap Number',
         yaxis_title='Lap Time (seconds)',
-        template='plotly_dark',
         hovermode='x unified',
         height=500
     )
@@ -348,20 +300,24 @@ def create_tyre_strategy_chart():
         'Stint': [0, 1, 2, 3, 4]
     })
     
-    colors = {'Soft': '#E74C3C', 'Hard': '#ECF0F1', 'Medium': '#F39C12'}
+    # One hover label per stint, built in a single pass
+    hovertext = [
+        f"<b>{d}</b><br>Tyre: {t}<br>Laps: {start}-{end}"
+        for d, t, start, end in zip(pit_data['Driver'].values, pit_data['Tyre'].values, pit_data['Start'].values, pit_data['End'].values)
+    ]
+    colors_arr = pit_data['Tyre'].map({'Soft': '#E74C3C', 'Hard': '#ECF0F1', 'Medium': '#F39C12'}).values
     
     fig = go.Figure()
     
-    for _, row in pit_data.iterrows():
-        fig.add_trace(go.Bar(
-            x=[row['End'] - row['Start']],
-            y=[row['Stint']],
-            base=row['Start'],
-            orientation='h',
-            name=f"{row['Driver']} - {row['Tyre']}",
-            marker=dict(color=colors[row['Tyre']], line=dict(color='black', width=1)),
-            hovertemplate=f"<b>{row['Driver']}</b><br>Tyre: {row['Tyre']}<br>Laps: {row['Start']}-{row['End']}<extra></extra>"
-        ))
+    fig.add_trace(go.Bar(
+        x=(pit_data['End'] - pit_data['Start']).values,
+        y=pit_data['Stint'].values,
+        base=pit_data['Start'].values,
+        orientation='h',
+        marker=dict(color=colors_arr, line=dict(color='black', width=1)),
+        hovertext=hovertext,
+        hoverinfo='text'
+    ))
     
     fig.update_layout(
         title='🛞 Tyre Strategy Timeline - The Winning Decision',
@@ -372,21 +328,16 @@ def create_tyre_strategy_chart():
             showgrid=False
         ),
         height=400,
-        template='plotly_dark',
         showlegend=False
     )
     
     return fig
 
-def create_position_chart(session):
+def create_position_chart(ver_laps, ham_laps):
     """Create race position timeline"""
-    laps = session.laps
-    ver_laps = laps.pick_drivers('VER')[['LapNumber', 'Position']]
-    ham_laps = laps.pick_drivers('HAM')[['LapNumber', 'Position']]
-    
     fig = go.Figure()
     
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=ver_laps['LapNumber'], 
         y=ver_laps['Position'],
         mode='lines+markers', 
@@ -395,7 +346,7 @@ def create_position_chart(session):
         marker=dict(size=6)
     ))
     
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=ham_laps['LapNumber'], 
         y=ham_laps['Position'],
         mode='lines+markers', 
@@ -417,12 +368,149 @@ def create_position_chart(session):
         xaxis_title='Lap Number',
         yaxis_title='Race Position',
         yaxis_autorange='reversed',
-        template='plotly_dark',
         height=400
     )
     
     return fig
 
+def section_overview():
+    """Render the race overview section"""
+    st.markdown('<h2 class="section-header">Race Overview</h2>', unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Race Winner", "Max Verstappen", "🏆")
+    with col2:
+        st.metric("Championship Decided", "Final Lap", "Lap 58")
+    with col3:
+        st.metric("Key Factor", "Tyre Strategy", "Soft vs Hard")
+    
+    st.markdown("""
+    **December 12, 2021** - The Yas Marina Circuit witnessed one of F1's most dramatic conclusions. 
+    Max Verstappen overcame Lewis Hamilton in the final lap to win his first World Championship.
+    
+    **Key Moments:**
+    - 🟡 Safety Car on Lap 53 changed everything
+    - 🔄 Verstappen's crucial pit stop for soft tyres
+    - 🏁 DRS-assisted overtake on the main straight
+    """)
+
+def section_telemetry(ver_tel, ham_tel):
+    """Render the fastest lap telemetry section"""
+    st.markdown('<h2 class="section-header">Fastest Lap Telemetry Comparison</h2>', unsafe_allow_html=True)
+    
+    figs = build_tel_figs(ver_tel, ham_tel)
+    
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["🏎️ Speed", "🚀 Throttle", "🛑 Braking", "⚙️ Gears", "🔄 RPM"])
+    
+    with tab1:
+        st.plotly_chart(figs['Speed'], use_container_width=True)
+        st.info("💡 **Key Insight**: Verstappen carries more speed through technical sections, particularly Turn 5 and Turn 9.")
+    
+    with tab2:
+        st.plotly_chart(figs['Throttle'], use_container_width=True)
+        st.info("💡 **Key Insight**: More aggressive throttle application by Verstappen out of slow-speed corners.")
+    
+    with tab3:
+        st.plotly_chart(figs['Brake'], use_container_width=True)
+        st.info("💡 **Key Insight**: Different braking patterns show contrasting driving styles and setup approaches.")
+    
+    with tab4:
+        st.plotly_chart(figs['nGear'], use_container_width=True)
+        st.info("💡 **Key Insight**: Gear usage patterns reveal acceleration and cornering strategies.")
+    
+    with tab5:
+        st.plotly_chart(figs['RPM'], use_container_width=True)
+        st.info("💡 **Key Insight**: RPM differences indicate power delivery and engine mapping strategies.")
+
+def section_race_pace(ver_laps, ham_laps):
+    """Render the race pace section"""
+    st.markdown('<h2 class="section-header">Lap Time Evolution</h2>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        st.plotly_chart(create_laptime_chart(ver_laps, ham_laps), use_container_width=True)
+    with col2:
+        st.markdown("""
+        **Race Pace Analysis:**
+    
+        🔵 **Hamilton's Dominance**
+        - Faster for most of the race
+        - Consistent pace on hard tyres
+        - Led by 11+ seconds before SC
+    
+        🔴 **Verstappen's Comeback**
+        - Struggled mid-race on hards
+        - Pace improved after Lap 50
+        - Fresh softs made the difference
+        """)
+    
+    st.plotly_chart(create_final_laps_chart(ver_laps, ham_laps), use_container_width=True)
+
+def section_strategy():
+    """Render the tyre strategy section"""
+    st.markdown('<h2 class="section-header">The Winning Strategy</h2>', unsafe_allow_html=True)
+    
+    st.plotly_chart(create_tyre_strategy_chart(), use_container_width=True)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("""
+        **Hamilton's Strategy:**
+        - 🟠 Medium → 🔵 Hard (Lap 14)
+        - One-stop strategy
+        - 44 laps on hard tyres
+        - Conservative approach
+        """)
+    
+    with col2:
+        st.markdown("""
+        **Verstappen's Strategy:**
+        - 🟠 Medium → 🔵 Hard → 🔴 Soft
+        - Opportunistic SC stop (Lap 53)
+        - Fresh soft tyres for final attack
+        - **Race-winning decision** 🏆
+        """)
+    
+    st.success("🎯 **Strategic Masterclass**: Red Bull's decision to pit under the Safety Car gave Verstappen a crucial tyre advantage for the final restart.")
+
+def section_final_moments(ver_laps, ham_laps, ver_tel_58, ham_tel_58):
+    """Render the final moments section"""
+    st.markdown('<h2 class="section-header">The Championship Decider</h2>', unsafe_allow_html=True)
+    
+    st.plotly_chart(create_position_chart(ver_laps, ham_laps), use_container_width=True)
+    
+    # Final lap analysis
+    st.markdown("### 🏁 Lap 58 - The Overtake")
+    
+    if ver_tel_58 is not None and ham_tel_58 is not None:
+        # Final lap speed chart
+        fig_final = go.Figure()
+        fig_final.add_trace(go.Scattergl(
+            x=ver_tel_58['Distance'].values, y=ver_tel_58['Speed'].values,
+            mode='lines', name='Verstappen', line=dict(color='#E74C3C', width=4)
+        ))
+        fig_final.add_trace(go.Scattergl(
+            x=ham_tel_58['Distance'].values, y=ham_tel_58['Speed'].values,
+            mode='lines', name='Hamilton', line=dict(color='#3498DB', width=4)
+        ))
+        fig_final.update_layout(
+            title='🏆 Final Lap Speed Comparison - The Championship Moment',
+            xaxis_title='Distance (m)', yaxis_title='Speed (km/h)',
+            height=500
+        )
+        st.plotly_chart(fig_final, use_container_width=True)
+    else:
+        st.warning("Final lap telemetry data not available for detailed analysis.")
+    
+    st.markdown("""
+    **The Decisive Moment:**
+    - 🟢 DRS enabled on main straight
+    - 🔴 Soft tyre advantage crucial
+    - 🏁 Overtake completed before Turn 5
+    - 🏆 World Championship decided
+    """)
+
 def main():
     # Header
     st.markdown('<h1 class="main-header">🏁 Abu Dhabi 2021: How Verstappen Beat Hamilton</h1>', unsafe_allow_html=True)
@@ -436,153 +524,28 @@ def main():
     )
     
     # Load data
-    session = load_race_data()
-    if session is None:
+    data = load_race_data()
+    if data is None:
         st.error("Failed to load race data. Please check your internet connection and try again.")
         return
     
-    # Get telemetry data
-    ver_tel, ham_tel, ver_laps, ham_laps = get_telemetry_data(session)
+    ver_tel, ham_tel = data['ver_tel'], data['ham_tel']
+    ver_laps, ham_laps = data['ver_laps'], data['ham_laps']
     
     if section == "📊 Overview":
-        st.markdown('<h2 class="section-header">Race Overview</h2>', unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Race Winner", "Max Verstappen", "🏆")
-        with col2:
-            st.metric("Championship Decided", "Final Lap", "Lap 58")
-        with col3:
-            st.metric("Key Factor", "Tyre Strategy", "Soft vs Hard")
-        
-        st.markdown("""
-        **December 12, 2021** - The Yas Marina Circuit witnessed one of F1's most dramatic conclusions. 
-        Max Verstappen overcame Lewis Hamilton in the final lap to win his first World Championship.
-        
-        **Key Moments:**
-        - 🟡 Safety Car on Lap 53 changed everything
-        - 🔄 Verstappen's crucial pit stop for soft tyres
-        - 🏁 DRS-assisted overtake on the main straight
-        """)
+        section_overview()
     
     elif section == "🔥 Telemetry Analysis":
-        st.markdown('<h2 class="section-header">Fastest Lap Telemetry Comparison</h2>', unsafe_allow_html=True)
-        
-        tab1, tab2, tab3, tab4, tab5 = st.tabs(["🏎️ Speed", "🚀 Throttle", "🛑 Braking", "⚙️ Gears", "🔄 RPM"])
-        
-        with tab1:
-            st.plotly_chart(create_speed_chart(ver_tel, ham_tel), use_container_width=True)
-            st.info("💡 **Key Insight**: Verstappen carries more speed through technical sections, particularly Turn 5 and Turn 9.")
-        
-        with tab2:
-            st.plotly_chart(create_throttle_chart(ver_tel, ham_tel), use_container_width=True)
-            st.info("💡 **Key Insight**: More aggressive throttle application by Verstappen out of slow-speed corners.")
-        
-        with tab3:
-            st.plotly_chart(create_brake_chart(ver_tel, ham_tel), use_container_width=True)
-            st.info("💡 **Key Insight**: Different braking patterns show contrasting driving styles and setup approaches.")
-        
-        with tab4:
-            st.plotly_chart(create_gear_chart(ver_tel, ham_tel), use_container_width=True)
-            st.info("💡 **Key Insight**: Gear usage patterns reveal acceleration and cornering strategies.")
-        
-        with tab5:
-            st.plotly_chart(create_rpm_chart(ver_tel, ham_tel), use_container_width=True)
-            st.info("💡 **Key Insight**: RPM differences indicate power delivery and engine mapping strategies.")
+        section_telemetry(ver_tel, ham_tel)
     
     elif section == "⏱️ Race Pace":
-        st.markdown('<h2 class="section-header">Lap Time Evolution</h2>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns([2, 1])
-        with col1:
-            st.plotly_chart(create_laptime_chart(ver_laps, ham_laps), use_container_width=True)
-        with col2:
-            st.markdown("""
-            **Race Pace Analysis:**
-            
-            🔵 **Hamilton's Dominance**
-            - Faster for most of the race
-            - Consistent pace on hard tyres
-            - Led by 11+ seconds before SC
-            
-            🔴 **Verstappen's Comeback**
-            - Struggled mid-race on hards
-            - Pace improved after Lap 50
-            - Fresh softs made the difference
-            """)
-        
-        st.plotly_chart(create_final_laps_chart(ver_laps, ham_laps), use_container_width=True)
+        section_race_pace(ver_laps, ham_laps)
     
     elif section == "🛞 Strategy Analysis":
-        st.markdown('<h2 class="section-header">The Winning Strategy</h2>', unsafe_allow_html=True)
-        
-        st.plotly_chart(create_tyre_strategy_chart(), use_container_width=True)
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown("""
-            **Hamilton's Strategy:**
-            - 🟠 Medium → 🔵 Hard (Lap 14)
-            - One-stop strategy
-            - 44 laps on hard tyres
-            - Conservative approach
-            """)
-        
-        with col2:
-            st.markdown("""
-            **Verstappen's Strategy:**
-            - 🟠 Medium → 🔵 Hard → 🔴 Soft
-            - Opportunistic SC stop (Lap 53)
-            - Fresh soft tyres for final attack
-            - **Race-winning decision** 🏆
-            """)
-        
-        st.success("🎯 **Strategic Masterclass**: Red Bull's decision to pit under the Safety Car gave Verstappen a crucial tyre advantage for the final restart.")
+        section_strategy()
     
     elif section == "📈 Final Moments":
-        st.markdown('<h2 class="section-header">The Championship Decider</h2>', unsafe_allow_html=True)
-        
-        st.plotly_chart(create_position_chart(session), use_container_width=True)
-        
-        # Final lap analysis
-        st.markdown("### 🏁 Lap 58 - The Overtake")
-        
-        try:
-            # Get final lap telemetry
-            laps = session.laps
-            ver_lap58 = laps.pick_drivers('VER').loc[laps['LapNumber'] == 58].iloc[0]
-            ham_lap58 = laps.pick_drivers('HAM').loc[laps['LapNumber'] == 58].iloc[0]
-            
-            ver_tel_58 = ver_lap58.get_telemetry().add_distance()
-            ham_tel_58 = ham_lap58.get_telemetry().add_distance()
-            
-            # Final lap speed chart
-            fig_final = go.Figure()
-            fig_final.add_trace(go.Scatter(
-                x=ver_tel_58['Distance'], y=ver_tel_58['Speed'],
-                mode='lines', name='Verstappen', line=dict(color='#E74C3C', width=4)
-            ))
-            fig_final.add_trace(go.Scatter(
-                x=ham_tel_58['Distance'], y=ham_tel_58['Speed'],
-                mode='lines', name='Hamilton', line=dict(color='#3498DB', width=4)
-            ))
-            fig_final.update_layout(
-                title='🏆 Final Lap Speed Comparison - The Championship Moment',
-                xaxis_title='Distance (m)', yaxis_title='Speed (km/h)',
-                template='plotly_dark', height=500
-            )
-            st.plotly_chart(fig_final, use_container_width=True)
-            
-        except Exception as e:
-            st.warning("Final lap telemetry data not available for detailed analysis.")
-        
-        st.markdown("""
-        **The Decisive Moment:**
-        - 🟢 DRS enabled on main straight
-        - 🔴 Soft tyre advantage crucial
-        - 🏁 Overtake completed before Turn 5
-        - 🏆 World Championship decided
-        """)
+        section_final_moments(ver_laps, ham_laps, data['lap58_ver_tel'], data['lap58_ham_tel'])
     
     # Footer
     st.markdown("---")
@@ -0,0 +1,23 @@
+"""Extract the race data app.py plots into parquet files under data/
+
+Run once at build time; app.py then loads these instead of FastF1:
+
+    python extract_data.py
+"""
+import os
+
+from app import DATA_DIR, extract_race_frames
+
+def main():
+    os.makedirs(DATA_DIR, exist_ok=True)
+    
+    for name, frame in extract_race_frames().items():
+        if frame is None:
+            print(f"Skipped {name}: not available")
+            continue
+        path = os.path.join(DATA_DIR, f'{name}.parquet')
+        frame.to_parquet(path, engine='pyarrow')
+        print(f"Wrote {path}")
+
+if __name__ == "__main__":
+    main()